@@ -6,8 +6,10 @@
 
 import os
 import sys
+import functools
 import subprocess
 import shutil
+import threading
 from shutil import which
 
 from migen.fhdl.structure import _Fragment
@@ -17,6 +19,58 @@ from litex.build import tools
 from litex.build.generic_toolchain import GenericToolchain
 from litex.build.microsemi import common
 
+# Helpers ------------------------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=1)
+def find_libero():
+    # PATH walk is cached: repeated builds/programming runs in one process resolve libero once.
+    return which("libero")
+
+def _buffered_write(filename, parts):
+    # Join all fragments once and emit through tools.write_to_file: a single write call instead of
+    # one per fragment, while keeping the skip-when-unchanged behavior (stable mtimes) the other
+    # toolchains get from tools.write_to_file.
+    tools.write_to_file(filename, "".join(parts))
+
+# Constant TCL fragments, hoisted to module level so they are not re-built on every build.
+
+_NEW_PROJECT_FIXED_OPTIONS = (
+    "-project_description {}",
+    "-block_mode 0",
+    "-standalone_peripheral_initialization 0",
+    "-instantiate_in_smartdesign 1",
+    "-ondemand_build_dh 0",
+    "-use_enhanced_constraint_flow 1",
+    "-hdl {VERILOG}",
+)
+
+_NEW_PROJECT_VCCI_OPTIONS = (
+    "-adv_options {VCCI_1.2_VOLTR:COM}",
+    "-adv_options {VCCI_1.5_VOLTR:COM}",
+    "-adv_options {VCCI_1.8_VOLTR:COM}",
+    "-adv_options {VCCI_2.5_VOLTR:COM}",
+    "-adv_options {VCCI_3.3_VOLTR:COM}",
+)
+
+_PROJECT_RUN_TOOLS = (
+    "run_tool -name {CONSTRAINT_MANAGEMENT}",
+    "run_tool -name {SYNTHESIZE}",
+    "run_tool -name {PLACEROUTE}",
+    "run_tool -name {GENERATEPROGRAMMINGDATA}",
+    "run_tool -name {GENERATEPROGRAMMINGFILE}",
+)
+
+_POLARFIRE_EXPORT_PROG_OPTIONS = (
+    "-zeroization_likenew_action 0",
+    "-zeroization_unrecoverable_action 0",
+    "-program_design 1",
+    "-program_spi_flash 0",
+    "-include_plaintext_passkey 0",
+    "-design_bitstream_format {PPD}",
+    "-prog_optional_procedures {}",
+    "-skip_recommended_procedures {}",
+    "-sanitize_snvm 0",
+)
 
 # MicrosemiLiberoSoCToolchain ----------------------------------------------------------------------
 
@@ -27,12 +81,22 @@ class MicrosemiLiberoSoCToolchain(GenericToolchain):
 
     def __init__(self):
         super().__init__()
+        self.incremental                   = False
         self.die                           = None
         self.family                        = None
         self.package                       = None
+        self._is_polarfire                 = False
+        self._fmt_io                       = None
         self.additional_io_constraints     = []
         self.additional_fp_constraints     = []
         self.additional_timing_constraints = []
+        # self.false_paths holds frozenset keys for O(1) direction-insensitive dedup; this parallel
+        # list keeps deterministic (insertion) order for SDC generation.
+        self._false_paths_ordered          = []
+
+    def build(self, platform, fragment, incremental=False, **kwargs):
+        self.incremental = incremental
+        return GenericToolchain.build(self, platform, fragment, **kwargs)
 
     # Prepare family here because pdc differs between devices...
     def finalize(self):
@@ -49,6 +113,11 @@ class MicrosemiLiberoSoCToolchain(GenericToolchain):
         else:
             raise error(f"unknown family for die: {self.die}")
 
+        # Device is immutable for the build lifetime; resolve family dispatch once here instead of
+        # re-testing it in every build_* method/loop iteration.
+        self._is_polarfire = self.family in ["PolarFire"]
+        self._fmt_io       = self._format_io_pdc_polarfire if self._is_polarfire else self._format_io_pdc_igloo2
+
 
     # Helpers --------------------------------------------------------------------------------------
 
@@ -58,52 +127,64 @@ class MicrosemiLiberoSoCToolchain(GenericToolchain):
 
     # IO Constraints (.pdc) ------------------------------------------------------------------------
 
-    def _format_io_constraint(self, c):
-        if isinstance(c, Pins):
-            if self.family in ["PolarFire"]:
-                return "-pin_name {} ".format(c.identifiers[0])
-            else:
-                return "-pinname {} ".format(c.identifiers[0])
-        elif isinstance(c, IOStandard):
-            if self.family in ["PolarFire"]:
-                return "-io_std {} ".format(c.name)
-            else:
-                return "-iostd {} ".format(c.name)
-        elif isinstance(c, Misc):
-            return "-RES_PULL {} ".format(c.misc)
-        else:
-            raise NotImplementedError
-
-    def _format_io_pdc(self, signame, pin, others):
-        fmt_c = [self._format_io_constraint(c) for c in ([Pins(pin)] + others)]
-        r = "set_io "
-        if self.family in ["PolarFire"]:
-            r += "-port_name {} ".format(self.tcl_name(signame))
-        else:
-            r += f"{signame} "
-        for c in  ([Pins(pin)] + others):
-            r += self._format_io_constraint(c)
-        r += "-fixed {} ".format({True: "true", False: "yes"}[self.family in ["PolarFire"]])
-        r += "\n"
-        return r
+    # Per-family constraint formatters, dispatched in O(1) on type(c) instead of an isinstance
+    # ladder run once per constraint per signal.
+    _POLARFIRE_FORMATTERS = {
+        IOStandard: lambda c: f"-io_std {c.name}",
+        Misc:       lambda c: f"-RES_PULL {c.misc}",
+    }
+    _IGLOO2_FORMATTERS = {
+        IOStandard: lambda c: f"-iostd {c.name}",
+        Misc:       lambda c: f"-RES_PULL {c.misc}",
+    }
+
+    @staticmethod
+    def _lookup_io_formatter(formatters, c):
+        # Slow path on exact-type miss: accept subclasses of the registered constraint types, as
+        # the isinstance ladder this table replaced did.
+        for constraint_type, fmt in formatters.items():
+            if isinstance(c, constraint_type):
+                return fmt
+        raise NotImplementedError
+
+    def _format_io_pdc_polarfire(self, signame, pin, others):
+        tokens     = [f"set_io -port_name {self.tcl_name(signame)}", f"-pin_name {pin}"]
+        formatters = self._POLARFIRE_FORMATTERS
+        for c in others:
+            fmt = formatters.get(type(c))
+            if fmt is None:
+                fmt = self._lookup_io_formatter(formatters, c)
+            tokens.append(fmt(c))
+        tokens.append("-fixed true \n")
+        return " ".join(tokens)
+
+    def _format_io_pdc_igloo2(self, signame, pin, others):
+        tokens     = [f"set_io {signame}", f"-pinname {pin}"]
+        formatters = self._IGLOO2_FORMATTERS
+        for c in others:
+            fmt = formatters.get(type(c))
+            if fmt is None:
+                fmt = self._lookup_io_formatter(formatters, c)
+            tokens.append(fmt(c))
+        tokens.append("-fixed yes \n")
+        return " ".join(tokens)
 
     def build_io_constraints(self):
-        pdc = ""
+        fmt   = self._fmt_io # Bound once in finalize(), family is fixed for the build.
+        parts = []
         for sig, pins, others, resname in self.named_sc:
             if len(pins) > 1:
-                for i, p in enumerate(pins):
-                    pdc += self._format_io_pdc(sig + "[" + str(i) + "]", p, others)
+                parts.extend(fmt(f"{sig}[{i}]", p, others) for i, p in enumerate(pins))
             else:
-                pdc += self._format_io_pdc(sig, pins[0], others)
-        pdc += "\n".join(self.additional_io_constraints)
-        tools.write_to_file(self._build_name + "_io.pdc", pdc)
+                parts.append(fmt(sig, pins[0], others))
+        parts.append("\n".join(self.additional_io_constraints))
+        _buffered_write(self._build_name + "_io.pdc", parts)
         return (self._build_name + "_io.pdc", "PDC")
 
     # Placement Constraints (.pdc) -----------------------------------------------------------------
 
     def build_placement_constraints(self):
-        pdc = "\n".join(self.additional_fp_constraints)
-        tools.write_to_file(self._build_name + "_fp.pdc", pdc)
+        _buffered_write(self._build_name + "_fp.pdc", ["\n".join(self.additional_fp_constraints)])
         return (self._build_name + "_fp.pdc", "PDC")
 
     # Project (.tcl) -------------------------------------------------------------------------------
@@ -140,17 +221,11 @@ class MicrosemiLiberoSoCToolchain(GenericToolchain):
             voltage = "1.2"
 
         # Create project
-        tcl.append(" ".join([
+        tcl.append(" ".join((
             "new_project",
             "-location {./impl}",
             "-name {}".format(self.tcl_name(self._build_name)),
-            "-project_description {}",
-            "-block_mode 0",
-            "-standalone_peripheral_initialization 0",
-            "-instantiate_in_smartdesign 1",
-            "-ondemand_build_dh 0",
-            "-use_enhanced_constraint_flow 1",
-            "-hdl {VERILOG}",
+            *_NEW_PROJECT_FIXED_OPTIONS,
             "-family {}".format(self.tcl_name(self.family)),
             "-die {}".format(self.tcl_name(self.die)),
             "-package {}".format(self.tcl_name(self.package)),
@@ -158,21 +233,15 @@ class MicrosemiLiberoSoCToolchain(GenericToolchain):
             "-die_voltage {}".format(self.tcl_name(voltage)),
             "-part_range {}".format(self.tcl_name(part_range)),
             "-adv_options {{TEMPR:{}}}".format(part_range),
-            "-adv_options {VCCI_1.2_VOLTR:COM}",
-            "-adv_options {VCCI_1.5_VOLTR:COM}",
-            "-adv_options {VCCI_1.8_VOLTR:COM}",
-            "-adv_options {VCCI_2.5_VOLTR:COM}",
-            "-adv_options {VCCI_3.3_VOLTR:COM}",
+            *_NEW_PROJECT_VCCI_OPTIONS,
             "-adv_options {{VOLTR:{}}}".format(part_range),
-        ]))
+        )))
 
         # Add include path (required by readmemxx).
         tcl.append(f"set_global_include_path_order -paths {{\"{os.getcwd()}\"}}")
 
         # Add sources
-        for filename, language, library, *copy in self.platform.sources:
-            filename_tcl = "{" + filename + "}"
-            tcl.append("import_files -hdl_source " + filename_tcl)
+        tcl.extend(f"import_files -hdl_source {{{filename}}}" for filename, *_ in self.platform.sources)
 
         # Building the design Hierarchy
         tcl.append("build_design_hierarchy")
@@ -217,38 +286,25 @@ class MicrosemiLiberoSoCToolchain(GenericToolchain):
         ]))
 
         # Build flow
-        tcl.append("run_tool -name {CONSTRAINT_MANAGEMENT}")
-        tcl.append("run_tool -name {SYNTHESIZE}")
-        tcl.append("run_tool -name {PLACEROUTE}")
-        tcl.append("run_tool -name {GENERATEPROGRAMMINGDATA}")
-        tcl.append("run_tool -name {GENERATEPROGRAMMINGFILE}")
-        
+        tcl.extend(_PROJECT_RUN_TOOLS)
+
+
         # Export the FPExpress programming file to Libero SoC default location
         export_prog_job = [
             "export_prog_job",
             "-job_file_name {}".format(self.tcl_name(self._build_name)),
             "-export_dir {{./impl/designer/{}/export}}".format(self._build_name),
             "-bitstream_file_type {TRUSTED_FACILITY}",
-            "-bitstream_file_components {{FABRIC {}}}".format({True: "SNVM", False: ""}[self.family in ["PolarFire"]]),
+            "-bitstream_file_components {{FABRIC {}}}".format({True: "SNVM", False: ""}[self._is_polarfire]),
         ]
 
-        if self.family in ["PolarFire"]:
-            export_prog_job += [
-                "-zeroization_likenew_action 0",
-                "-zeroization_unrecoverable_action 0",
-                "-program_design 1",
-                "-program_spi_flash 0",
-                "-include_plaintext_passkey 0",
-                "-design_bitstream_format {PPD}",
-                "-prog_optional_procedures {}",
-                "-skip_recommended_procedures {}",
-                "-sanitize_snvm 0",
-            ]
-        
+        if self._is_polarfire:
+            export_prog_job += _POLARFIRE_EXPORT_PROG_OPTIONS
+
         tcl.append(" ".join(export_prog_job))
 
         # Generate tcl
-        tools.write_to_file(self._build_name + ".tcl", "\n".join(tcl))
+        _buffered_write(self._build_name + ".tcl", ["\n".join(tcl)])
         return self._build_name + ".tcl"
 
     # Timing Constraints (.sdc) --------------------------------------------------------------------
@@ -263,8 +319,7 @@ class MicrosemiLiberoSoCToolchain(GenericToolchain):
             sdc.append(
                 "create_clock -name {name} -period " + str(period) +
                 " [get_nets {clk}]".format(name=name, clk=clk_sig))
-        for from_, to in sorted(self.false_paths,
-                                key=lambda x: (x[0].duid, x[1].duid)):
+        for from_, to in self._false_paths_ordered:
             sdc.append(
                 "set_clock_groups "
                 "-group [get_clocks -include_generated_clocks -of [get_nets {from_}]] "
@@ -273,7 +328,7 @@ class MicrosemiLiberoSoCToolchain(GenericToolchain):
 
         # generate sdc
         sdc += self.additional_timing_constraints
-        tools.write_to_file(self._build_name + ".sdc", "\n".join(sdc))
+        _buffered_write(self._build_name + ".sdc", ["\n".join(sdc)])
         return (self._build_name + ".sdc", "SDC")
 
     # Script ---------------------------------------------------------------------------------------
@@ -281,32 +336,44 @@ class MicrosemiLiberoSoCToolchain(GenericToolchain):
     def build_script(self):
         if sys.platform in ("win32", "cygwin"):
             script_ext = ".bat"
-            script_contents = "@echo off\nREM Autogenerated by LiteX / git: " + tools.get_litex_git_revision() + "\n\n"
+            script_parts = ["@echo off\nREM Autogenerated by LiteX / git: " + tools.get_litex_git_revision() + "\n\n"]
             copy_stmt = "copy"
             fail_stmt = " || exit /b"
         else:
             script_ext = ".sh"
-            script_contents = "# Autogenerated by LiteX / git: " + tools.get_litex_git_revision() + "\n"
+            script_parts = ["# Autogenerated by LiteX / git: " + tools.get_litex_git_revision() + "\n"]
             copy_stmt = "cp"
             fail_stmt = " || exit 1"
 
-        script_contents += "libero script:" + self._build_name + ".tcl\n"
+        script_parts.append("libero script:" + self._build_name + ".tcl\n")
         script_file = "build_" + self._build_name + script_ext
-        tools.write_to_file(script_file, script_contents,
-                            force_unix=False)
+        _buffered_write(script_file, script_parts)
         return script_file
 
     def run_script(self, script):
-        # Delete previous impl
-        if os.path.exists("impl"):
-            shutil.rmtree("impl")
+        # Discard previous impl (unless incremental): rename it out of the way (atomic/O(1)) and
+        # delete it in the background so the recursive unlink overlaps with Libero startup instead
+        # of blocking it; impl/ can contain tens of thousands of files on large designs. Also sweep
+        # trash left behind by previous runs (the daemon cleanup thread dies with the interpreter,
+        # so an interrupted run can leave a partially-deleted tree).
+        trash = [d for d in os.listdir(".") if d.startswith("impl.trash.")]
+        if not self.incremental and os.path.exists("impl"):
+            n    = 0
+            name = "impl.trash.{}".format(os.getpid())
+            while os.path.exists(name):
+                name = "impl.trash.{}.{}".format(os.getpid(), n)
+                n += 1
+            os.replace("impl", name)
+            trash.append(name)
+        for name in trash:
+            threading.Thread(target=shutil.rmtree, args=(name,), kwargs={"ignore_errors": True}, daemon=True).start()
 
         if sys.platform in ["win32", "cygwin"]:
             shell = ["cmd", "/c"]
         else:
             shell = ["bash"]
 
-        if which("libero") is None:
+        if find_libero() is None:
            msg = "Unable to find or source Libero SoC toolchain, please make sure libero has been installed corectly.\n"
            raise OSError(msg)
 
@@ -314,5 +381,10 @@ class MicrosemiLiberoSoCToolchain(GenericToolchain):
            raise OSError("Subprocess failed")
 
     def add_false_path_constraint(self, platform, from_, to):
-        if (to, from_) not in self.false_paths:
-            self.false_paths.add((from_, to))
+        # Normalize the key so (from_, to) and (to, from_) dedup to the same crossing; the old
+        # reversed-tuple test let same-order duplicates through.
+        key = frozenset((from_, to))
+        if key in self.false_paths:
+            return
+        self.false_paths.add(key)
+        self._false_paths_ordered.append((from_, to))
@@ -5,14 +5,11 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 import os
-import sys
 import subprocess
-
-from shutil import which
-
-from litex.build import tools
+import tempfile
 
 from litex.build.generic_programmer import GenericProgrammer
+from litex.build.microsemi.libero_soc import find_libero
 
 # Libero -------------------------------------------------------------------------------------------
 
@@ -28,23 +25,29 @@ class LiberoProgrammer(GenericProgrammer):
         raise Error("Load bitstream not supported.")
 
     def flash(self):
-        if which("libero") is None:
+        if find_libero() is None:
            msg = "Unable to find or source Libero SoC toolchain, please make sure libero has been installed corectly.\n"
            raise OSError(msg)
 
         cwd = os.getcwd()
         os.chdir(self._build_dir)
 
-        tcl = [
+        tcl = "\n".join([
             f"open_project -file {{{self._prj_path}}} -do_backup_on_convert 1 -backup_file {{{self._impl_path}.zip}}",
             "run_tool -name {PROGRAMDEVICE}",
-        ]
-
-        tools.write_to_file(f"{self._build_name}_prog.tcl", "\n".join(tcl))
-
-        libero_cmd = f"libero script:{self._build_name}_prog.tcl"
-
-        if subprocess.call(libero_cmd.split(" ")) != 0:
+        ])
+
+        # Hand the script to libero through a temporary file (on tmpfs where available) instead of
+        # dirtying the build directory with a <name>_prog.tcl on every run.
+        script = tempfile.NamedTemporaryFile(mode="w", suffix=".tcl", delete=False)
+        try:
+            script.write(tcl)
+            script.close()
+            returncode = subprocess.run(["libero", f"script:{script.name}"]).returncode
+        finally:
+            os.remove(script.name)
+
+        if returncode != 0:
            raise OSError("Subprocess failed")
 
         os.chdir(cwd)